@@ -2,19 +2,30 @@
 How to share the same color map
 across different meshes.
 """
-from vtkplotter import load, Text, show, datadir
+from vtkplotter import load, Actor, Text, show, datadir, settings
 
+# map scalars to colors per vertex, no need for an intermediate texture
+settings.interpolateScalarsBeforeMapping = False
 
-#####################################
 man1 = load(datadir+"man.vtk")
-scals = man1.coordinates()[:, 2] * 5 + 27  # pick z coordinates [18->34]
-
-man1.pointColors(scals, cmap="jet", vmin=18, vmax=44)
+man2 = Actor(man1.polydata())  # share the same geometry, nothing is copied
 
 #####################################
-man2 = load(datadir+"man.vtk")
-scals = man2.coordinates()[:, 2] * 5 + 37  # pick z coordinates [28->44]
+z5 = man1.coordinates()[:, 2] * 5  # pick z coordinates, same for both meshes
+
+man1.pointColors(z5 + 27, cmap="jet", vmin=18, vmax=44)  # [18->34]
+
+man2.addPointScalars(z5 + 37, "scals2")  # [28->44]
+
+# each mapper picks its own array by name from the shared point data,
+# man2 reuses the lookup table already built for man1
+man1.mapper.SetScalarModeToUsePointFieldData()
+man1.mapper.SelectColorArray(man1.mapper.GetArrayName())
+man2.mapper.SetScalarModeToUsePointFieldData()
+man2.mapper.SelectColorArray("scals2")
+man2.mapper.SetLookupTable(man1.mapper.GetLookupTable())
+man2.mapper.SetScalarRange(18, 44)
 
-man2.pointColors(scals, cmap="jet", vmin=18, vmax=44)
+doc = Text(__doc__)  # build the text overlay once and reuse it
 
-show([[man1, Text(__doc__)], man2], N=2, elevation=-40)
+show([[man1, doc], man2], N=2, elevation=-40)
@@ -13,24 +13,32 @@ class MainWindow(Qt.QMainWindow):
     def __init__(self, parent=None):
 
         Qt.QMainWindow.__init__(self, parent)
-        self.frame = Qt.QFrame()
-        self.vl = Qt.QVBoxLayout()
-        self.vtkWidget = QVTKRenderWindowInteractor(self.frame)
-        self.vl.addWidget(self.vtkWidget)
+        self.vtkWidget = QVTKRenderWindowInteractor(self)
 
         vp = Plotter(qtWidget=self.vtkWidget, axes=4, bg='white')
 
-        vp += Cone()
-        vp.show()      # create renderer and add the actors
+        vp += Cone().flat()  # flat shading is enough for this preview
 
         # set-up the rest of the Qt window
-        self.frame.setLayout(self.vl)
-        self.setCentralWidget(self.frame)
+        self.setCentralWidget(self.vtkWidget)
 
         self.show()    # <--- show the Qt Window
 
+        # create renderer and add the actors only once the window has its
+        # final size, so that the scene is rendered just once at startup
+        Qt.QTimer.singleShot(0, vp.show)
+
 
 if __name__ == "__main__":
+    # set the OpenGL surface format VTK needs before the application starts,
+    # so that the context is not recreated and rendering is synced to vsync
+    fmt = Qt.QSurfaceFormat()
+    fmt.setVersion(3, 2)
+    fmt.setProfile(Qt.QSurfaceFormat.CoreProfile)
+    fmt.setSwapInterval(1)
+    fmt.setSamples(0)
+    Qt.QSurfaceFormat.setDefaultFormat(fmt)
+
     app = Qt.QApplication(sys.argv)
     window = MainWindow()
     app.exec_()
@@ -1,5 +1,6 @@
 from __future__ import division, print_function
 
+import math
 import numpy as np
 import os
 import vtk
@@ -7,7 +8,8 @@ import vtkplotter.colors as colors
 import vtkplotter.docs as docs
 import vtkplotter.settings as settings
 import vtkplotter.utils as utils
-from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+from collections import OrderedDict
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy, numpy_to_vtkIdTypeArray
 
 __doc__ = (
     """
@@ -17,6 +19,13 @@ and ``vtkImageActor`` objects functionality.
     + docs._defs
 )
 
+# opt-in: with VTKPLOTTER_SMP set (e.g. STDThread, TBB) the vtk filters based on
+# vtkSMPTools (clipping, thresholding, normals...) use that backend. This is process
+# wide, so nothing is changed by default or when VTK_SMP_BACKEND_IN_USE is set
+if (os.environ.get("VTKPLOTTER_SMP") and "VTK_SMP_BACKEND_IN_USE" not in os.environ
+        and hasattr(vtk, "vtkSMPTools") and hasattr(vtk.vtkSMPTools, "SetBackend")):
+    vtk.vtkSMPTools.SetBackend(os.environ["VTKPLOTTER_SMP"])
+
 __all__ = [
     'Prop',
     'Actor',
@@ -55,22 +64,140 @@ def mergeActors(*actors):
 
         |thinplate_grid| |value-iteration|
     """
-    acts = []
+    polylns = vtk.vtkAppendPolyData()
+    last, nacts = None, 0
     for a in utils.flatten(actors):
         if isinstance(a, vtk.vtkAssembly):
-            acts += a.getActors()
+            acts = a.getActors()
         else:
-            acts += [a]
-    if len(acts) == 1:
-        return acts[0].clone()
-    polylns = vtk.vtkAppendPolyData()
-    for a in acts:
-        polylns.AddInputData(a.polydata())
+            acts = (a,)
+        for last in acts:
+            polylns.AddInputData(last.polydata())
+            nacts += 1
+    if nacts == 1:
+        return last.clone()
     polylns.Update()
     pd = polylns.GetOutput()
     return Actor(pd)
 
 
+def _versor3(v):
+    """Normalize a 3-vector with plain floats, avoiding numpy dispatch."""
+    x, y, z = v
+    n = math.sqrt(x*x + y*y + z*z)
+    if not n:
+        return (x, y, z)
+    return (x/n, y/n, z/n)
+
+
+_textureImages = OrderedDict()  # (abspath, mtime) -> vtkImageData, least recently used first
+_maxTextureImages = 64
+
+
+def _loadTexture(fn):
+    """Return a new ``vtkTexture`` for an image file. The decoded image is
+    kept in a small cache and reused as long as the file is not modified."""
+    path = os.path.abspath(fn)
+    key = (path, os.path.getmtime(fn))
+    img = _textureImages.pop(key, None)
+    if img is None:
+        if ".png" in fn.lower():
+            reader = vtk.vtkPNGReader()
+        elif ".jp" in fn.lower():
+            reader = vtk.vtkJPEGReader()
+        elif ".bmp" in fn.lower():
+            reader = vtk.vtkBMPReader()
+        else:
+            return None
+        reader.SetFileName(fn)
+        reader.Update()
+        img = reader.GetOutput()
+        for k in [k for k in _textureImages if k[0] == path]:
+            del _textureImages[k]  # older versions of the same file
+        while len(_textureImages) >= _maxTextureImages:
+            _textureImages.popitem(last=False)
+    _textureImages[key] = img  # (re)inserted as most recently used
+    atext = vtk.vtkTexture()  # one per actor, its settings are not shared
+    atext.SetInputData(img)
+    return atext
+
+
+def _transformPolyData(poly, M):
+    """Apply the affine 4x4 numpy matrix `M` to the points of a polydata
+    and to its active vectors and normals, as ``vtkTransformPolyDataFilter`` does.
+    Cells and the other arrays are shared with the input, not copied.
+    Return None if `M` is not affine and invertible."""
+    A, t = M[:3, :3], M[:3, 3]
+    if not poly.GetNumberOfPoints() or np.any(M[3] != (0, 0, 0, 1)):
+        return None
+    try:
+        Ainv = np.linalg.inv(A)
+    except np.linalg.LinAlgError:
+        return None
+
+    out = vtk.vtkPolyData()
+    out.ShallowCopy(poly)
+    pts = vtk_to_numpy(poly.GetPoints().GetData())
+    newpts = vtk.vtkPoints()
+    newpts.SetData(numpy_to_vtk((np.dot(pts, A.T) + t).astype(pts.dtype)))
+    out.SetPoints(newpts)
+
+    for data, outdata in ((poly.GetPointData(), out.GetPointData()),
+                          (poly.GetCellData(), out.GetCellData())):
+        vecs = data.GetVectors()
+        if vecs is not None:
+            v = vtk_to_numpy(vecs)
+            varr = numpy_to_vtk(np.dot(v, A.T).astype(v.dtype))
+            varr.SetName(vecs.GetName())
+            outdata.SetVectors(varr)
+        nrms = data.GetNormals()
+        if nrms is not None:
+            n = np.dot(vtk_to_numpy(nrms), Ainv)  # inverse transpose
+            nn = np.sqrt(np.einsum('ij,ij->i', n, n))
+            nn[nn == 0] = 1
+            narr = numpy_to_vtk((n / nn[:, None]).astype(vtk_to_numpy(nrms).dtype))
+            narr.SetName(nrms.GetName())
+            outdata.SetNormals(narr)
+    return out
+
+
+def _buildLUT(rgb, alpha, useAlpha, stretch=False):
+    """Build a ``vtkLookupTable`` from a list of (r,g,b) colors in one go.
+    If `useAlpha` each color takes its opacity from the `alpha` list,
+    which is stretched over the whole table if `stretch` is True."""
+    n = len(rgb)
+    rgba = np.empty((n, 4))
+    rgba[:, :3] = rgb
+    if useAlpha:
+        if stretch:
+            rgba[:, 3] = np.asarray(alpha)[(np.arange(n) / n * len(alpha)).astype(int)]
+        else:
+            rgba[:, 3] = alpha[:n]
+    else:
+        rgba[:, 3] = alpha
+    lut = vtk.vtkLookupTable()
+    lut.SetNumberOfTableValues(n)
+    lut.SetTable(numpy_to_vtk((rgba * 255 + 0.5).astype(np.uint8),
+                              array_type=vtk.VTK_UNSIGNED_CHAR))
+    return lut
+
+
+def _scalarsArray(scalars, vtkarr=None):
+    """Return a vtk array for the scalars passed to ``pointColors()/cellColors()``.
+    An existing `vtkarr` is shallow copied so that its buffer is shared,
+    otherwise values keep their own numeric type, so that a large offset does not
+    eat the resolution of the color range, and are only deep copied if the buffer
+    belongs to the caller."""
+    if vtkarr is not None:
+        arr = vtkarr.NewInstance()
+        arr.ShallowCopy(vtkarr)
+        return arr
+    buf = np.ascontiguousarray(scalars)
+    if buf.dtype.kind not in "iuf" or buf.dtype == np.float16:
+        buf = buf.astype(float)  # no vtk counterpart
+    return numpy_to_vtk(buf, deep=np.may_share_memory(buf, scalars))
+
+
 # classes
 class Prop(object):
     """Adds functionality to ``Actor``, ``Assembly`` and ``Volume`` objects.
@@ -84,11 +211,26 @@ class Prop(object):
         self.trail = None
         self.trailPoints = []
         self.trailSegmentSize = 0
+        self._trailSegmentSize2 = 0
         self.trailOffset = None
         self.shadow = None
         self.shadowX = None
         self.shadowY = None
         self.shadowZ = None
+        self._shadowMatrix = None
+        self._shadowAxis = None
+        self._shadowVal = None
+        self._diagonalSize = None  # (key, value) cache for diagonalSize()
+        self._pointsRef = None
+        self._transformedPoly = None  # (key, polydata, mtime) cache for polydata(True)
+        self._identity = None  # (mtime, bool) cache for _isIdentity()
+        self._massProps = None
+        self._normalsKey = None  # mesh produced by the last computeNormals() call
+        self._ippd = None  # (polydata, mtime, vtkImplicitPolyDataDistance) for cutWithMesh()
+        self._arrayNames = None  # (key, names) cache for scalars()
+        self._bandsCache = None  # (vtkarray, key, banded) for pointColors()/cellColors()
+        self._enclosedSel = None  # (polydata, key, vtkSelectEnclosedPoints) for isInside()
+        self._cellCenters = None  # (polydata, key, centers) cache for cellCenters()
         self.units = None
         self.top = None
         self.base = None
@@ -97,12 +239,15 @@ class Prop(object):
         self._legend = None
         self.scalarbar = None
         self.renderedAt = set()
+        self.mapper = None  # cached mapper handle, set by the subclasses
         #self.k3dobj = None
 
 
     def inputdata(self):
         """Return the VTK input data object."""
-        return self.GetMapper().GetInput()
+        if self.mapper is None:
+            return self.GetMapper().GetInput()
+        return self.mapper.GetInput()
 
 
     def N(self):
@@ -186,23 +331,17 @@ class Prop(object):
             x, y, z = x
         self.SetPosition(x, y, z)
 
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.updateShadow()
+        self._postMove()
         return self  # return itself to concatenate methods
 
     def addPos(self, dp_x=None, dy=None, dz=None):
         """Add vector to current actor position."""
-        p = np.array(self.GetPosition())
+        p = self.GetPosition()
         if dz is None:  # assume dp_x is of the form (x,y,z)
-            self.SetPosition(p + dp_x)
+            self.SetPosition(p[0] + dp_x[0], p[1] + dp_x[1], p[2] + dp_x[2])
         else:
-            self.SetPosition(p + [dp_x, dy, dz])
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.updateShadow()
+            self.SetPosition(p[0] + dp_x, p[1] + dy, p[2] + dz)
+        self._postMove()
         return self
 
     def x(self, position=None):
@@ -211,10 +350,7 @@ class Prop(object):
         if position is None:
             return p[0]
         self.SetPosition(position, p[1], p[2])
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.updateShadow()
+        self._postMove()
         return self
 
     def y(self, position=None):
@@ -223,10 +359,7 @@ class Prop(object):
         if position is None:
             return p[1]
         self.SetPosition(p[0], position, p[2])
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.updateShadow()
+        self._postMove()
         return self
 
     def z(self, position=None):
@@ -235,10 +368,7 @@ class Prop(object):
         if position is None:
             return p[2]
         self.SetPosition(p[0], p[1], position)
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.updateShadow()
+        self._postMove()
         return self
 
     def rotate(self, angle, axis=(1, 0, 0), axis_point=(0, 0, 0), rad=False):
@@ -246,71 +376,48 @@ class Prop(object):
         if rad:
             anglerad = angle
         else:
-            anglerad = np.deg2rad(angle)
-        axis = utils.versor(axis)
-        a = np.cos(anglerad / 2)
-        b, c, d = -axis * np.sin(anglerad / 2)
-        aa, bb, cc, dd = a * a, b * b, c * c, d * d
-        bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
-        R = np.array(
-            [
-                [aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
-                [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
-                [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc],
-            ]
-        )
-        rv = np.dot(R, self.GetPosition() - np.array(axis_point)) + axis_point
+            anglerad = math.radians(angle)
+        ax, ay, az = _versor3(axis)
+        # rotate the actor position with Rodrigues' formula
+        px, py, pz = axis_point
+        x, y, z = self.GetPosition()
+        vx, vy, vz = x - px, y - py, z - pz
+        cs, sn = math.cos(anglerad), math.sin(anglerad)
+        k = (ax*vx + ay*vy + az*vz) * (1 - cs)
+        rv = (vx*cs + (ay*vz - az*vy)*sn + ax*k + px,
+              vy*cs + (az*vx - ax*vz)*sn + ay*k + py,
+              vz*cs + (ax*vy - ay*vx)*sn + az*k + pz)
 
         if rad:
-            angle *= 180.0 / np.pi
+            angle = math.degrees(angle)
         # this vtk method only rotates in the origin of the actor:
-        self.RotateWXYZ(angle, axis[0], axis[1], axis[2])
+        self.RotateWXYZ(angle, ax, ay, az)
         self.SetPosition(rv)
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.addShadow(self.shadowX, self.shadowY, self.shadowZ,
-                           self.shadow.GetProperty().GetColor(),
-                           self.shadow.GetProperty().GetOpacity())
+        self._postMove(rotated=True)
         return self
 
     def rotateX(self, angle, axis_point=(0, 0, 0), rad=False):
         """Rotate around x-axis. If angle is in radians set ``rad=True``."""
         if rad:
-            angle *= 180 / np.pi
+            angle = math.degrees(angle)
         self.RotateX(angle)
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.addShadow(self.shadowX, self.shadowY, self.shadowZ,
-                           self.shadow.GetProperty().GetColor(),
-                           self.shadow.GetProperty().GetOpacity())
+        self._postMove(rotated=True)
         return self
 
     def rotateY(self, angle, axis_point=(0, 0, 0), rad=False):
         """Rotate around y-axis. If angle is in radians set ``rad=True``."""
         if rad:
-            angle *= 180.0 / np.pi
+            angle = math.degrees(angle)
         self.RotateY(angle)
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.addShadow(self.shadowX, self.shadowY, self.shadowZ,
-                           self.shadow.GetProperty().GetColor(),
-                           self.shadow.GetProperty().GetOpacity())
+        self._postMove(rotated=True)
         return self
 
     def rotateZ(self, angle, axis_point=(0, 0, 0), rad=False):
         """Rotate around z-axis. If angle is in radians set ``rad=True``."""
         if rad:
-            angle *= 180.0 / np.pi
+            angle = math.degrees(angle)
         self.RotateZ(angle)
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.addShadow(self.shadowX, self.shadowY, self.shadowZ,
-                           self.shadow.GetProperty().GetColor(),
-                           self.shadow.GetProperty().GetOpacity())
+        self._postMove(rotated=True)
         return self
 
     def orientation(self, newaxis=None, rotation=0, rad=False):
@@ -323,31 +430,30 @@ class Prop(object):
         |gyroscope2| |gyroscope2.py|_
         """
         if rad:
-            rotation *= 180.0 / np.pi
+            rotation = math.degrees(rotation)
         if self.top is None or self.base is None:
             initaxis = (0,0,1)
         else:
             initaxis = utils.versor(self.top - self.base)
         if newaxis is None:
             return initaxis
-        newaxis = utils.versor(newaxis)
-        pos = np.array(self.GetPosition())
-        crossvec = np.cross(initaxis, newaxis)
-        angle = np.arccos(np.dot(initaxis, newaxis))
+        ia = initaxis
+        na = utils.versor(newaxis)
+        pos = self.GetPosition()
+        crossvec = (ia[1]*na[2] - ia[2]*na[1],
+                    ia[2]*na[0] - ia[0]*na[2],
+                    ia[0]*na[1] - ia[1]*na[0])
+        dot = ia[0]*na[0] + ia[1]*na[1] + ia[2]*na[2]
+        angle = math.acos(max(-1.0, min(1.0, dot)))
         T = vtk.vtkTransform()
         T.PostMultiply()
-        T.Translate(-pos)
+        T.Translate(-pos[0], -pos[1], -pos[2])
         if rotation:
             T.RotateWXYZ(rotation, initaxis)
-        T.RotateWXYZ(np.rad2deg(angle), crossvec)
+        T.RotateWXYZ(math.degrees(angle), crossvec)
         T.Translate(pos)
         self.SetUserMatrix(T.GetMatrix())
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.addShadow(self.shadowX, self.shadowY, self.shadowZ,
-                           self.shadow.GetProperty().GetColor(),
-                           self.shadow.GetProperty().GetOpacity())
+        self._postMove(rotated=True)
         return self
 
     def scale(self, s=None):
@@ -362,6 +468,39 @@ class Prop(object):
         self.SetScale(s)
         return self  # return itself to concatenate methods
 
+    def _postMove(self, rotated=False):
+        """Update trail and shadow after the actor has been moved or rotated."""
+        if self.trail:
+            self.updateTrail()
+        if self.shadow:
+            if rotated and self._shadowMatrix != self._linearMatrix():
+                # the projected shape changes, update the shadow mesh in place
+                self.shadow.updateMesh(self._projectShadow())
+            self.updateShadow()
+
+    def _linearMatrix(self):
+        """Return the rotation and scaling part of the actor matrix as a tuple."""
+        M = self.GetMatrix()
+        return tuple(M.GetElement(i, j) for i in range(3) for j in range(3))
+
+    def _projectShadow(self):
+        """Return the actor mesh squashed onto the shadow plane, relative to the actor position.
+        The shadow actor is then placed on the plane by ``updateShadow()``."""
+        self._shadowMatrix = self._linearMatrix()
+        squash = [1, 1, 1]
+        squash[self._shadowAxis] = 0
+        p = self.GetPosition()
+        T = vtk.vtkTransform()
+        T.PostMultiply()
+        T.SetMatrix(self.GetMatrix())
+        T.Translate(-p[0], -p[1], -p[2])
+        T.Scale(squash)
+        tf = vtk.vtkTransformPolyDataFilter()
+        tf.SetTransform(T)
+        tf.SetInputData(self.polydata(False))
+        tf.Update()
+        return tf.GetOutput()
+
     def addShadow(self, x=None, y=None, z=None, c=(0.5, 0.5, 0.5), alpha=1):
         """
         Generate a shadow out of an ``Actor`` on one of the three Cartesian planes.
@@ -377,32 +516,26 @@ class Prop(object):
 
             |airplanes| |airplanes.py|_
         """
+        if x is None and y is None and z is None:
+            print('Error in addShadow(): must set x, y or z to a float!')
+            return self
+        self.shadowX, self.shadowY, self.shadowZ = x, y, z
         if x is not None:
-            self.shadowX = x
-            shad = self.clone().projectOnPlane('x').x(x)
+            self._shadowAxis, self._shadowVal = 0, x
         elif y is not None:
-            self.shadowY = y
-            shad = self.clone().projectOnPlane('y').y(y)
-        elif z is not None:
-            self.shadowZ = z
-            shad = self.clone().projectOnPlane('z').z(z)
+            self._shadowAxis, self._shadowVal = 1, y
         else:
-            print('Error in addShadow(): must set x, y or z to a float!')
-            return self
-        shad.c(c).alpha(alpha).wireframe(False)
-        shad.flat().backFaceCulling()
+            self._shadowAxis, self._shadowVal = 2, z
+        shad = Actor(self._projectShadow(), c, alpha)
+        shad.wireframe(False).flat().backFaceCulling()
         shad.GetProperty().LightingOff()
         self.shadow = shad
-        return self
+        return self.updateShadow()
 
     def updateShadow(self):
-        p = self.GetPosition()
-        if self.shadowX is not None:
-            self.shadow.SetPosition(self.shadowX, p[1], p[2])
-        elif self.shadowY is not None:
-            self.shadow.SetPosition(p[0], self.shadowY, p[2])
-        elif self.shadowZ is not None:
-            self.shadow.SetPosition(p[0], p[1], self.shadowZ)
+        p = list(self.GetPosition())
+        p[self._shadowAxis] = self._shadowVal
+        self.shadow.SetPosition(p)
         return self
 
     def addTrail(self, offset=None, maxlength=None, n=50, c=None, alpha=None, lw=2):
@@ -424,14 +557,19 @@ class Prop(object):
                 maxlength = 1
 
         if self.trail is None:
-            pos = self.GetPosition()
-            self.trailPoints = [None] * n
+            pos = np.array(self.GetPosition())
+            if offset is not None:
+                offset = np.asarray(offset, dtype=float)
+                pos += offset
+            self.trailPoints = np.tile(pos.astype(np.float32), (n, 1))
             self.trailSegmentSize = maxlength / n
+            self._trailSegmentSize2 = self.trailSegmentSize**2
             self.trailOffset = offset
 
             ppoints = vtk.vtkPoints()  # Generate the polyline
             poly = vtk.vtkPolyData()
-            ppoints.SetData(numpy_to_vtk([pos] * n))
+            ppoints.SetData(numpy_to_vtk(self.trailPoints, deep=False,
+                                         array_type=vtk.VTK_FLOAT))  # shares the buffer
             poly.SetPoints(ppoints)
             lines = vtk.vtkCellArray()
             lines.InsertNextCell(n)
@@ -439,7 +577,6 @@ class Prop(object):
                 lines.InsertCellPoint(i)
             poly.SetPoints(ppoints)
             poly.SetLines(lines)
-            mapper = vtk.vtkPolyDataMapper()
 
             if c is None:
                 if hasattr(self, "GetProperty"):
@@ -454,29 +591,28 @@ class Prop(object):
                 if hasattr(self, "GetProperty"):
                     alpha = self.GetProperty().GetOpacity()
 
-            mapper.SetInputData(poly)
             tline = Actor(poly, c=col, alpha=alpha)
-            tline.SetMapper(mapper)
             tline.GetProperty().SetLineWidth(lw)
             self.trail = tline  # holds the vtkActor
         return self
 
     def updateTrail(self):
-        currentpos = np.array(self.GetPosition())
-        if self.trailOffset:
-            currentpos += self.trailOffset
-        lastpos = self.trailPoints[-1]
-        if lastpos is None:  # reset list
-            self.trailPoints = [currentpos] * len(self.trailPoints)
-            return
-        if np.linalg.norm(currentpos - lastpos) < self.trailSegmentSize:
+        x, y, z = self.GetPosition()
+        if self.trailOffset is not None:
+            ox, oy, oz = self.trailOffset
+            x, y, z = x + ox, y + oy, z + oz
+        lx, ly, lz = self.trailPoints[-1].tolist()
+        dx, dy, dz = x - lx, y - ly, z - lz
+        if dx*dx + dy*dy + dz*dz < self._trailSegmentSize2:
             return
 
-        self.trailPoints.append(currentpos)  # cycle
-        self.trailPoints.pop(0)
+        # roll the buffer back by one point and write the current position in place
+        tp = self.trailPoints
+        tp[:-1] = tp[1:]
+        tp[-1] = (x, y, z)
 
-        tpoly = self.trail.polydata()
-        tpoly.GetPoints().SetData(numpy_to_vtk(self.trailPoints))
+        # the vtk points share the buffer of trailPoints, just flag them as modified
+        self.trail.polydata(False).GetPoints().Modified()
         return self
 
     def print(self):
@@ -688,7 +824,8 @@ class Actor(vtk.vtkActor, Prop):
     :param bool wire:  show surface as wireframe
     :param bc: backface color of internal surface
     :param str texture: jpg file name or surface texture name
-    :param bool computeNormals: compute point and cell normals at creation
+    :param bool computeNormals: compute point and cell normals at creation if missing,
+        use `'force'` to recompute them even if they already exist.
 
     .. hint:: A mesh can be built from vertices and their connectivity. See e.g.:
 
@@ -708,13 +845,10 @@ class Actor(vtk.vtkActor, Prop):
         self.poly = None
         self.mapper = None
 
-        inputtype = str(type(inputobj))
-        # print('inputtype',inputtype)
-
         if inputobj is None:
             self.poly = vtk.vtkPolyData()
             self.mapper = vtk.vtkPolyDataMapper()
-        elif "Actor" in inputtype:
+        elif isinstance(inputobj, vtk.vtkActor):
             polyCopy = vtk.vtkPolyData()
             polyCopy.DeepCopy(inputobj.GetMapper().GetInput())
             self.poly = polyCopy
@@ -724,16 +858,22 @@ class Actor(vtk.vtkActor, Prop):
             pr = vtk.vtkProperty()
             pr.DeepCopy(inputobj.GetProperty())
             self.SetProperty(pr)
-        elif "PolyData" in inputtype:
+        elif isinstance(inputobj, vtk.vtkPolyData):
             if inputobj.GetNumberOfCells() == 0:
+                # add one vertex cell per point, in the (1, id) legacy layout
+                ast = np.int32
+                if vtk.vtkIdTypeArray().GetDataTypeSize() != 4:
+                    ast = np.int64
+                npt = inputobj.GetNumberOfPoints()
+                conn = np.ones(2*npt, dtype=ast)
+                conn[1::2] = np.arange(npt, dtype=ast)
                 carr = vtk.vtkCellArray()
-                for i in range(inputobj.GetNumberOfPoints()):
-                    carr.InsertNextCell(1)
-                    carr.InsertCellPoint(i)
+                carr.SetCells(npt, numpy_to_vtkIdTypeArray(conn))
                 inputobj.SetVerts(carr)
             self.poly = inputobj  # cache vtkPolyData and mapper for speed
             self.mapper = vtk.vtkPolyDataMapper()
-        elif "structured" in inputtype.lower() or "RectilinearGrid" in inputtype:
+        elif isinstance(inputobj, (vtk.vtkUnstructuredGrid, vtk.vtkStructuredGrid,
+                                   vtk.vtkStructuredPoints, vtk.vtkRectilinearGrid)):
             if settings.visibleGridEdges:
                 gf = vtk.vtkExtractEdges()
                 gf.SetInputData(inputobj)
@@ -750,7 +890,7 @@ class Actor(vtk.vtkActor, Prop):
 #            gf.Update()
 #            self.poly = gf.GetOutput()
 #            self.mapper = vtk.vtkPolyDataMapper()
-        elif "trimesh" in inputtype:
+        elif "trimesh" in type(inputobj).__module__:
             tact = utils.trimesh2vtk(inputobj, alphaPerCell=False)
             self.poly = tact.polydata()
             self.mapper = vtk.vtkPolyDataMapper()
@@ -762,19 +902,21 @@ class Actor(vtk.vtkActor, Prop):
             self.mapper = vtk.vtkPolyDataMapper()
 
         else:
-            colors.printc("Error: cannot build Actor from type:\n", inputtype, c=1)
+            colors.printc("Error: cannot build Actor from type:\n", type(inputobj), c=1)
             raise RuntimeError()
 
 
         if self.mapper:
-            self.mapper.InterpolateScalarsBeforeMappingOn()
+            self.mapper.SetInterpolateScalarsBeforeMapping(settings.interpolateScalarsBeforeMapping)
             self.SetMapper(self.mapper)
 
         if settings.computeNormals is not None:
             computeNormals = settings.computeNormals
 
         if self.poly:
-            if computeNormals:
+            if computeNormals == 'force' or (computeNormals and (
+                    self.poly.GetPointData().GetNormals() is None
+                    or self.poly.GetCellData().GetNormals() is None)):
                 pdnorm = vtk.vtkPolyDataNormals()
                 pdnorm.SetInputData(self.poly)
                 pdnorm.ComputePointNormalsOn()
@@ -814,36 +956,27 @@ class Actor(vtk.vtkActor, Prop):
                 cldata = self.poly.GetCellData()
                 exclude = ['normals', 'tcoord']
 
-                if cldata.GetNumberOfArrays():
-                    for i in range(cldata.GetNumberOfArrays()):
-                        iarr = cldata.GetArray(i)
-                        icname = iarr.GetName()
-#                        if icname is None:
-#                            icname = 'cellarray'
-#                            iarr.SetName(icname)
-                        if icname and all(s not in icname.lower() for s in exclude):
-                            cldata.SetActiveScalars(icname)
-                            self.mapper.ScalarVisibilityOn()
-                            self.mapper.SetScalarModeToUseCellData()
-                            self.mapper.SetScalarRange(iarr.GetRange())
-                            arrexists = True
-                            break # stop at first good one
+                # only names are scanned, the array is fetched when one is picked
+                for i in range(cldata.GetNumberOfArrays()):
+                    icname = cldata.GetArrayName(i)
+                    if icname and all(s not in icname.lower() for s in exclude):
+                        cldata.SetActiveScalars(icname)
+                        self.mapper.ScalarVisibilityOn()
+                        self.mapper.SetScalarModeToUseCellData()
+                        self.mapper.SetScalarRange(cldata.GetArray(i).GetRange())
+                        arrexists = True
+                        break # stop at first good one
 
                 # point come after so it has priority
-                if ptdata.GetNumberOfArrays():
-                    for i in range(ptdata.GetNumberOfArrays()):
-                        iarr = ptdata.GetArray(i)
-                        ipname = iarr.GetName()
-#                        if ipname is None:
-#                            ipname = 'pointarray'
-#                            iarr.SetName(ipname)
-                        if ipname and all(s not in ipname.lower() for s in exclude):
-                            ptdata.SetActiveScalars(ipname)
-                            self.mapper.ScalarVisibilityOn()
-                            self.mapper.SetScalarModeToUsePointData()
-                            self.mapper.SetScalarRange(iarr.GetRange())
-                            arrexists = True
-                            break
+                for i in range(ptdata.GetNumberOfArrays()):
+                    ipname = ptdata.GetArrayName(i)
+                    if ipname and all(s not in ipname.lower() for s in exclude):
+                        ptdata.SetActiveScalars(ipname)
+                        self.mapper.ScalarVisibilityOn()
+                        self.mapper.SetScalarModeToUsePointData()
+                        self.mapper.SetScalarRange(ptdata.GetArray(i).GetRange())
+                        arrexists = True
+                        break
 
             if arrexists == False:
                 if c is None:
@@ -861,14 +994,21 @@ class Actor(vtk.vtkActor, Prop):
 
 
     ###############################################
+    def SetMapper(self, mapper):
+        """Set the ``vtkMapper`` of the actor, keeping the cached mapper in sync."""
+        if mapper is not self.mapper:
+            self.mapper = mapper
+            self.poly = None  # will be retrieved from the new mapper input
+        vtk.vtkActor.SetMapper(self, mapper)
+
     def __add__(self, actors):
         if isinstance(actors, list):
             alist = [self]
             for l in actors:
                 if isinstance(l, vtk.vtkAssembly):
-                    alist += l.getActors()
+                    alist.extend(l.getActors())
                 else:
-                    alist += l
+                    alist.append(l)
             return Assembly(alist)
         elif isinstance(actors, vtk.vtkAssembly):
             actors.AddPart(self)
@@ -886,6 +1026,10 @@ class Actor(vtk.vtkActor, Prop):
         self.poly = polydata
         self.mapper.SetInputData(polydata)
         self.mapper.Modified()
+        self.point_locator = None
+        self.cell_locator = None
+        self.line_locator = None
+        self._normalsKey = None
         return self
 
 
@@ -896,14 +1040,14 @@ class Actor(vtk.vtkActor, Prop):
 
         :param int i: index of vertex point.
 
-        .. warning:: if used in a loop this can slow down the execution by a lot.
-
         .. seealso:: ``actor.getPoints()``
         """
-        poly = self.polydata(True)
-        p = [0, 0, 0]
-        poly.GetPoints().GetPoint(i, p)
-        return np.array(p)
+        return np.array(self._pointsView(True)[i], dtype=float)
+
+    def _pointsView(self, transformed):
+        """Return a numpy view of the mesh points. The view is built again on each
+        call, as vtk can reallocate the buffer behind the same array object."""
+        return vtk_to_numpy(self.polydata(transformed).GetPoints().GetData())
 
     def setPoint(self, i, p):
         """
@@ -913,13 +1057,10 @@ class Actor(vtk.vtkActor, Prop):
         :param int i: index of vertex point.
         :param list p: new coordinates of mesh point.
 
-        .. warning:: if used in a loop this can slow down the execution by a lot.
-
         .. seealso:: ``actor.Points()``
         """
-        poly = self.polydata(False)
-        poly.GetPoints().SetPoint(i, p)
-        poly.GetPoints().Modified()
+        self._pointsView(False)[i] = p
+        self.polydata(False).GetPoints().Modified()
         # reset actor to identity matrix position/rotation:
         self.PokeMatrix(vtk.vtkMatrix4x4())
         return self
@@ -942,10 +1083,22 @@ class Actor(vtk.vtkActor, Prop):
         Actor transformation is reset to its mesh position/orientation.
 
         :param list pts: new coordinates of mesh vertices.
-        """
-        vpts = self.poly.GetPoints()
-        vpts.SetData(numpy_to_vtk(np.ascontiguousarray(pts), deep=True))
-        self.poly.GetPoints().Modified()
+
+        .. note:: a writeable, C-contiguous numpy array of floats (e.g. a float32
+            array updated in an animation loop) is shared with vtk, not copied:
+            the actor keeps it alive and later in-place changes to it show up in
+            the mesh after ``actor.polydata(False).GetPoints().Modified()``.
+            Any other input, including read-only views, is copied first.
+        """
+        arr = np.ascontiguousarray(pts)
+        if arr.dtype.kind != 'f':
+            arr = arr.astype(np.float32)
+        elif not arr.flags.writeable:
+            arr = arr.copy()  # vtk filters may write into the shared buffer
+        self._pointsRef = arr  # keep the shared buffer alive
+        vpts = self.polydata(False).GetPoints()
+        vpts.SetData(numpy_to_vtk(arr, deep=False))
+        vpts.Modified()
         # reset actor to identity matrix position/rotation:
         self.PokeMatrix(vtk.vtkMatrix4x4())
         return self
@@ -964,29 +1117,79 @@ class Actor(vtk.vtkActor, Prop):
         """
         return vtk_to_numpy(self.polydata().GetPolys().GetData())
 
-    def getConnectivity(self):
+    def getConnectivity(self, asarray=False):
         """Get cell connettivity ids as a python ``list``. The format is:
             [[id0 ... idn], [id0 ... idm],  etc].
 
+        :param bool asarray: if all cells have the same number of vertices
+            return a numpy array of shape `(ncells, nvertices)` instead of a list.
+
         Same as `faces()`.
         """
-        arr1d = self.getPolygons()
-        if len(arr1d) == 0:
-            arr1d = vtk_to_numpy(self.polydata().GetStrips().GetData())
+        carr = self.polydata().GetPolys()
+        if not carr.GetNumberOfCells():
+            carr = self.polydata().GetStrips()
+        arr1d = vtk_to_numpy(carr.GetData())
+        n = len(arr1d)
+        if n == 0:
+            return np.zeros((0, 3), dtype=arr1d.dtype) if asarray else []
+
+        # fast path: all cells have the same nr of vertices (e.g. triangles)
+        k = int(arr1d[0])
+        if n % (k+1) == 0:
+            cells = arr1d.reshape(-1, k+1)
+            if (cells[:, 0] == k).all():
+                if asarray:
+                    return np.array(cells[:, 1:])  # own copy, the legacy export buffer is not kept
+                return cells[:, 1:].tolist()
+
+        if hasattr(carr, "GetOffsetsArray"):
+            # vtk9 stores the cell offsets explicitly, no need to walk the cells
+            ids = vtk_to_numpy(carr.GetConnectivityArray()).tolist()
+            offs = vtk_to_numpy(carr.GetOffsetsArray()).tolist()
+            return [ids[offs[j]:offs[j+1]] for j in range(len(offs)-1)]
 
         i = 0
         conn = []
-        n = len(arr1d)
-        for idummy in range(n):
-            cell = []
-            for k in range(arr1d[i]):
-                cell.append(arr1d[i+k+1])
-            conn.append(cell)
-            i += arr1d[i]+1
-            if i >= n:
-                break
+        while i < n:
+            k = arr1d[i]
+            conn.append(arr1d[i+1:i+k+1].tolist())
+            i += k+1
         return conn # cannot always make a numpy array of it!
 
+    def setConnectivity(self, faces):
+        """Set the polygonal cells of the mesh from an array of vertex ids
+        of shape `(ncells, nvertices)`, e.g. `[[0,1,2], [2,1,3], ...]`.
+        Cells with a different number of vertices can be passed as a list of lists.
+
+        .. seealso:: ``actor.getConnectivity()``
+        """
+        ast = np.int32
+        if vtk.vtkIdTypeArray().GetDataTypeSize() != 4:
+            ast = np.int64
+        try:
+            arr = np.asarray(faces, dtype=ast)
+        except ValueError:  # cells of different sizes
+            arr = None
+        if arr is not None and arr.ndim == 1 and arr.size:
+            arr = arr.reshape(1, -1)  # a single flat face, e.g. [0,1,2]
+
+        polys = vtk.vtkCellArray()
+        if arr is not None and arr.ndim == 2:
+            nf, nc = arr.shape
+            hs = np.empty((nf, nc+1), dtype=ast)
+            hs[:, 0] = nc
+            hs[:, 1:] = arr
+            polys.SetCells(nf, numpy_to_vtkIdTypeArray(hs.ravel()))
+        else:
+            for f in faces:
+                polys.InsertNextCell(len(f))
+                for i in f:
+                    polys.InsertCellPoint(i)
+        self.polydata(False).SetPolys(polys)
+        self.mapper.Modified()
+        return self
+
     def addScalarBar(self, c=None, title="", horizontal=False, vmin=None, vmax=None):
         """
         Add a 2D scalar bar to actor.
@@ -1049,20 +1252,10 @@ class Actor(vtk.vtkActor, Prop):
             print()
             return self
 
-        if ".png" in fn.lower():
-            reader = vtk.vtkPNGReader()
-        elif ".jp" in fn.lower():
-            reader = vtk.vtkJPEGReader()
-        elif ".bmp" in fn.lower():
-            reader = vtk.vtkBMPReader()
-        else:
+        atext = _loadTexture(fn)
+        if atext is None:
             colors.printc("~times Supported texture files: PNG or JPG", c="r")
             return self
-        reader.SetFileName(fn)
-        reader.Update()
-        img = reader.GetOutput()
-        atext = vtk.vtkTexture()
-        atext.SetInputData(img)
         self.GetProperty().SetColor(1, 1, 1)
         self.SetTexture(atext)
         self.Modified()
@@ -1073,14 +1266,24 @@ class Actor(vtk.vtkActor, Prop):
 
         |deleteMeshPoints| |deleteMeshPoints.py|_
         """
-        cellIds = vtk.vtkIdList()
-        self.poly.BuildLinks()
-        for i in indices:
-            self.poly.GetPointCells(i, cellIds)
-            for j in range(cellIds.GetNumberOfIds()):
-                self.poly.DeleteCell(cellIds.GetId(j))  # flag cell
-
-        self.poly.RemoveDeletedCells()
+        poly = self.polydata(False)
+        conn = None
+        if poly.GetNumberOfPolys() and poly.GetNumberOfPolys() == poly.GetNumberOfCells():
+            conn = self.getConnectivity(asarray=True)
+        if isinstance(conn, np.ndarray):
+            # all cells are polygons of the same size: find them in one numpy pass
+            poly.BuildCells()
+            for c in np.nonzero(np.isin(conn, indices).any(axis=1))[0]:
+                poly.DeleteCell(int(c))  # flag cell
+        else:
+            cellIds = vtk.vtkIdList()
+            poly.BuildLinks()
+            for i in indices:
+                poly.GetPointCells(i, cellIds)
+                for j in range(cellIds.GetNumberOfIds()):
+                    poly.DeleteCell(cellIds.GetId(j))  # flag cell
+
+        poly.RemoveDeletedCells()
         self.mapper.Modified()
         return self
 
@@ -1090,6 +1293,10 @@ class Actor(vtk.vtkActor, Prop):
         .. warning:: Mesh gets modified, output can have a different nr. of vertices.
         """
         poly = self.polydata(False)
+        # nothing to do if the mesh is still the output of the same computation
+        key = (id(poly), poly.GetMTime(), points, cells)
+        if key == self._normalsKey:
+            return self
         pdnorm = vtk.vtkPolyDataNormals()
         pdnorm.SetInputData(poly)
         pdnorm.SetComputePointNormals(points)
@@ -1097,7 +1304,10 @@ class Actor(vtk.vtkActor, Prop):
         pdnorm.FlipNormalsOff()
         pdnorm.ConsistencyOn()
         pdnorm.Update()
-        return self.updateMesh(pdnorm.GetOutput())
+        out = pdnorm.GetOutput()
+        self.updateMesh(out)
+        self._normalsKey = (id(out), out.GetMTime(), points, cells)
+        return self
 
     def reverse(self, cells=True, normals=False):
         """
@@ -1214,12 +1424,13 @@ class Actor(vtk.vtkActor, Prop):
             return self
         elif isinstance(c, str):
             if c in colors._mapscales_cmaps:
-                if self.poly.GetPointData().GetScalars():
-                    aname = self.poly.GetPointData().GetScalars().GetName()
-                    if aname: self.pointColors(aname, cmap=c)
-                if self.poly.GetCellData().GetScalars():
-                    aname = self.poly.GetCellData().GetScalars().GetName()
-                    if aname: self.cellColors(aname, cmap=c)
+                poly = self.polydata(False)
+                sc = poly.GetPointData().GetScalars()
+                if sc and sc.GetName():
+                    self.pointColors(sc.GetName(), cmap=c)
+                sc = poly.GetCellData().GetScalars()
+                if sc and sc.GetName():
+                    self.cellColors(sc.GetName(), cmap=c)
                 self.mapper.ScalarVisibilityOn()
                 return self
         self.mapper.ScalarVisibilityOff()
@@ -1350,23 +1561,29 @@ class Actor(vtk.vtkActor, Prop):
         coords = self.coordinates(copy=False)
         if not len(coords):
             return 0
-        s, c = 0.0, 0.0
-        n = len(coords)
-        step = int(n / 10000.0) + 1
-        for i in np.arange(0, n, step):
-            s += utils.mag(coords[i] - cm)
-            c += 1
-        return s / c
+        step = int(len(coords) / 10000.0) + 1
+        sub = coords[::step] - cm
+        return float(np.sqrt(np.einsum('ij,ij->i', sub, sub)).mean())
 
     def diagonalSize(self):
         """Get the length of the diagonal of actor bounding box."""
-        b = self.polydata().GetBounds()
-        return np.sqrt((b[1] - b[0]) ** 2 + (b[3] - b[2]) ** 2 + (b[5] - b[4]) ** 2)
+        # the value is cached until either the mesh or the actor matrix are modified
+        poly = self.polydata(False)
+        key = (id(poly), poly.GetMTime(), self.GetMTime())
+        if self._diagonalSize is None or self._diagonalSize[0] != key:
+            b = self._boundsArray()
+            d = float(np.linalg.norm(b[:, 1] - b[:, 0]))
+            self._diagonalSize = (key, d)
+        return self._diagonalSize[1]
 
     def maxBoundSize(self):
         """Get the maximum dimension in x, y or z of the actor bounding box."""
-        b = self.polydata(True).GetBounds()
-        return max(abs(b[1] - b[0]), abs(b[3] - b[2]), abs(b[5] - b[4]))
+        b = self._boundsArray()
+        return float(np.max(np.abs(b[:, 1] - b[:, 0])))
+
+    def _boundsArray(self):
+        """Return the bounds of the transformed mesh as a (3,2) array."""
+        return np.array(self.polydata(True).GetBounds()).reshape(3, 2)
 
     def centerOfMass(self):
         """Get the center of mass of actor.
@@ -1379,13 +1596,22 @@ class Actor(vtk.vtkActor, Prop):
         c = cmf.GetCenter()
         return np.array(c)
 
+    def _massProperties(self):
+        """Return a ``vtkMassProperties`` object for the current mesh,
+        cached as long as the (transformed) mesh is not modified."""
+        poly = self.polydata()
+        key = (id(poly), poly.GetMTime())
+        if self._massProps is None or self._massProps[0] != key:
+            mass = vtk.vtkMassProperties()
+            mass.SetGlobalWarningDisplay(0)
+            mass.SetInputData(poly)
+            mass.Update()
+            self._massProps = (key, mass)
+        return self._massProps[1]
+
     def volume(self, value=None):
         """Get/set the volume occupied by actor."""
-        mass = vtk.vtkMassProperties()
-        mass.SetGlobalWarningDisplay(0)
-        mass.SetInputData(self.polydata())
-        mass.Update()
-        v = mass.GetVolume()
+        v = self._massProperties().GetVolume()
         if value is not None:
             if not v:
                 colors.printc("~bomb Volume is zero: cannot rescale.", c=1, end="")
@@ -1401,11 +1627,7 @@ class Actor(vtk.vtkActor, Prop):
 
         .. hint:: |largestregion.py|_
         """
-        mass = vtk.vtkMassProperties()
-        mass.SetGlobalWarningDisplay(0)
-        mass.SetInputData(self.polydata())
-        mass.Update()
-        ar = mass.GetSurfaceArea()
+        ar = self._massProperties().GetSurfaceArea()
         if value is not None:
             if not ar:
                 colors.printc("~bomb Area is zero: cannot rescale.", c=1, end="")
@@ -1433,35 +1655,27 @@ class Actor(vtk.vtkActor, Prop):
         poly = self.polydata(True)
 
         if N > 1 or radius:
-            plocexists = self.point_locator
-            if not plocexists or (plocexists and self.point_locator is None):
-                point_locator = vtk.vtkPointLocator()
-                point_locator.SetDataSet(poly)
-                point_locator.BuildLocator()
-                self.point_locator = point_locator
+            if self.point_locator is None or self.point_locator.GetDataSet() is not poly:
+                self.point_locator = vtk.vtkKdTreePointLocator()
+                self.point_locator.SetDataSet(poly)
+            self.point_locator.Update()  # rebuilds only if the mesh was modified
 
             vtklist = vtk.vtkIdList()
             if N > 1:
                 self.point_locator.FindClosestNPoints(N, pt, vtklist)
             else:
                 self.point_locator.FindPointsWithinRadius(radius, pt, vtklist)
+            ids = [int(vtklist.GetId(k)) for k in range(vtklist.GetNumberOfIds())]
             if returnIds:
-                return [int(vtklist.GetId(k)) for k in range(vtklist.GetNumberOfIds())]
+                return ids
             else:
-                trgp = []
-                for i in range(vtklist.GetNumberOfIds()):
-                    trgp_ = [0, 0, 0]
-                    vi = vtklist.GetId(i)
-                    poly.GetPoints().GetPoint(vi, trgp_)
-                    trgp.append(trgp_)
-                return np.array(trgp)
-
-        clocexists = self.cell_locator
-        if not clocexists or (clocexists and self.cell_locator is None):
-            cell_locator = vtk.vtkCellLocator()
-            cell_locator.SetDataSet(poly)
-            cell_locator.BuildLocator()
-            self.cell_locator = cell_locator
+                pts = vtk_to_numpy(poly.GetPoints().GetData())
+                return np.array(pts[ids], dtype=float)
+
+        if self.cell_locator is None or self.cell_locator.GetDataSet() is not poly:
+            self.cell_locator = vtk.vtkCellLocator()
+            self.cell_locator.SetDataSet(poly)
+        self.cell_locator.Update()
 
         trgp = [0, 0, 0]
         cid = vtk.mutable(0)
@@ -1502,17 +1716,23 @@ class Actor(vtk.vtkActor, Prop):
         self.mapper.ScalarVisibilityOn()
         return self
 
-    def clone(self, transformed=True):
+    def clone(self, transformed=True, shallow=False):
         """
         Clone a ``Actor(vtkActor)`` and make an exact copy of it.
 
         :param transformed: if `False` ignore any previous transformation applied to the mesh.
+        :param bool shallow: share the points, cells and data arrays with the original
+            mesh instead of copying them. Much faster for large meshes, but modifying
+            the arrays in place will then affect both actors.
 
         |carcrash| |carcrash.py|_
         """
         poly = self.polydata(transformed=transformed)
         polyCopy = vtk.vtkPolyData()
-        polyCopy.DeepCopy(poly)
+        if shallow:
+            polyCopy.ShallowCopy(poly)
+        else:
+            polyCopy.DeepCopy(poly)
 
         cloned = Actor()
         cloned.poly = polyCopy
@@ -1543,13 +1763,19 @@ class Actor(vtk.vtkActor, Prop):
             tr.SetMatrix(transformation)
             transformation = tr
 
-        tf = vtk.vtkTransformPolyDataFilter()
-
-        tf.SetTransform(transformation)
-        tf.SetInputData(self.polydata())
-        tf.Update()
+        newpoly = None
+        if isinstance(transformation, vtk.vtkLinearTransform):
+            M = transformation.GetMatrix()
+            M = np.array([[M.GetElement(i, j) for j in range(4)] for i in range(4)])
+            newpoly = _transformPolyData(self.polydata(), M)
+        if newpoly is None:
+            tf = vtk.vtkTransformPolyDataFilter()
+            tf.SetTransform(transformation)
+            tf.SetInputData(self.polydata())
+            tf.Update()
+            newpoly = tf.GetOutput()
         self.PokeMatrix(vtk.vtkMatrix4x4())  # identity
-        return self.updateMesh(tf.GetOutput())
+        return self.updateMesh(newpoly)
 
     def normalize(self):
         """
@@ -1560,16 +1786,11 @@ class Actor(vtk.vtkActor, Prop):
         if not len(coords):
             return
         pts = coords - cm
-        xyz2 = np.sum(pts * pts, axis=0)
-        scale = 1 / np.sqrt(np.sum(xyz2) / len(pts))
-        t = vtk.vtkTransform()
-        t.Scale(scale, scale, scale)
-        t.Translate(-cm)
-        tf = vtk.vtkTransformPolyDataFilter()
-        tf.SetInputData(self.poly)
-        tf.SetTransform(t)
-        tf.Update()
-        return self.updateMesh(tf.GetOutput())
+        scale = 1 / np.sqrt(np.einsum('ij,ij->', pts, pts) / len(pts))
+        M = np.identity(4)
+        M[:3, :3] *= scale
+        M[:3, 3] = -scale * cm
+        return self.updateMesh(_transformPolyData(self.polydata(False), M))
 
     def mirror(self, axis="x"):
         """
@@ -1597,21 +1818,28 @@ class Actor(vtk.vtkActor, Prop):
             colors.printc("~times Error in mirror(): mirror must be set to x, y, z or n.", c=1)
             raise RuntimeError()
 
+        hasNormals = polyCopy.GetPointData().GetNormals() is not None
         if axis != "n":
-            for j in range(polyCopy.GetNumberOfPoints()):
-                p = [0, 0, 0]
-                polyCopy.GetPoint(j, p)
-                polyCopy.GetPoints().SetPoint(
-                    j,
-                    p[0] * sx - dx * (sx - 1),
-                    p[1] * sy - dy * (sy - 1),
-                    p[2] * sz - dz * (sz - 1),
-                )
+            # reflect all points in place on the numpy view of the copy
+            s = np.array([sx, sy, sz])
+            pts = vtk_to_numpy(polyCopy.GetPoints().GetData())
+            pts *= s
+            pts -= np.array([dx, dy, dz]) * (s - 1)
+            polyCopy.GetPoints().Modified()
+            if hasNormals:
+                # existing normals are reflected the same way, no need to recompute them
+                for nrms in (polyCopy.GetPointData().GetNormals(),
+                             polyCopy.GetCellData().GetNormals()):
+                    if nrms is not None:
+                        vtk_to_numpy(nrms)[:] *= s
+                        nrms.Modified()
         rs = vtk.vtkReverseSense()
         rs.SetInputData(polyCopy)
-        rs.ReverseNormalsOn()
+        rs.SetReverseNormals(axis == "n" or not hasNormals)
         rs.Update()
         polyCopy = rs.GetOutput()
+        if hasNormals:
+            return self.updateMesh(polyCopy)
 
         pdnorm = vtk.vtkPolyDataNormals()
         pdnorm.SetInputData(polyCopy)
@@ -1620,7 +1848,11 @@ class Actor(vtk.vtkActor, Prop):
         pdnorm.FlipNormalsOff()
         pdnorm.ConsistencyOn()
         pdnorm.Update()
-        return self.updateMesh(pdnorm.GetOutput())
+        out = pdnorm.GetOutput()
+        self.updateMesh(out)
+        # same pass as computeNormals(points=True, cells=True)
+        self._normalsKey = (id(out), out.GetMTime(), True, True)
+        return self
 
     def flipNormals(self):
         """
@@ -1680,12 +1912,7 @@ class Actor(vtk.vtkActor, Prop):
         T.Translate(q1)
 
         self.SetUserMatrix(T.GetMatrix())
-        if self.trail:
-            self.updateTrail()
-        if self.shadow:
-            self.addShadow(self.shadowX, self.shadowY, self.shadowZ,
-                           self.shadow.GetProperty().GetColor(),
-                           self.shadow.GetProperty().GetOpacity())
+        self._postMove(rotated=True)
         return self
 
     def crop(self, top=None, bottom=None, right=None, left=None, front=None, back=None):
@@ -1706,17 +1933,13 @@ class Actor(vtk.vtkActor, Prop):
 
             |cropped|
         """
-        x0, x1, y0, y1, z0, z1 = self.GetBounds()
+        b = np.array(self.GetBounds()).reshape(3, 2)
+        d = b[:, 1] - b[:, 0]
+        lo = b[:, 0] + np.array([left or 0, back or 0, bottom or 0]) * d
+        hi = b[:, 1] - np.array([right or 0, front or 0, top or 0]) * d
 
         cu = vtk.vtkBox()
-        dx, dy, dz = x1-x0, y1-y0, z1-z0
-        if top:    z1 = z1 - top*dz
-        if bottom: z0 = z0 + bottom*dz
-        if front:  y1 = y1 - front*dy
-        if back:   y0 = y0 + back*dy
-        if right:  x1 = x1 - right*dx
-        if left:   x0 = x0 + left*dx
-        cu.SetBounds(x0,x1, y0,y1, z0,z1)
+        cu.SetBounds(lo[0], hi[0], lo[1], hi[1], lo[2], hi[2])
 
         poly = self.polydata()
         clipper = vtk.vtkClipPolyData()
@@ -1761,7 +1984,6 @@ class Actor(vtk.vtkActor, Prop):
         plane.SetOrigin(origin)
         plane.SetNormal(normal)
 
-        self.computeNormals()
         poly = self.polydata()
         clipper = vtk.vtkClipPolyData()
         clipper.SetInputData(poly)
@@ -1799,7 +2021,7 @@ class Actor(vtk.vtkActor, Prop):
         """
         if isinstance(mesh, vtk.vtkPolyData):
             polymesh = mesh
-        if isinstance(mesh, Actor):
+        elif isinstance(mesh, Actor):
             polymesh = mesh.polydata()
         else:
             polymesh = mesh.GetMapper().GetInput()
@@ -1810,15 +2032,24 @@ class Actor(vtk.vtkActor, Prop):
         signedDistances.SetNumberOfComponents(1)
         signedDistances.SetName("SignedDistances")
 
-        # implicit function that will be used to slice the mesh
-        ippd = vtk.vtkImplicitPolyDataDistance()
-        ippd.SetInput(polymesh)
+        # implicit function that will be used to slice the mesh,
+        # an Actor cutter keeps it (and its locator) until its mesh changes
+        cache = getattr(mesh, "_ippd", None)
+        if cache is not None and cache[0] is polymesh and cache[1] == polymesh.GetMTime():
+            ippd = cache[2]
+        else:
+            ippd = vtk.vtkImplicitPolyDataDistance()
+            ippd.SetInput(polymesh)
+            if isinstance(mesh, Actor):
+                mesh._ippd = (polymesh, polymesh.GetMTime(), ippd)
 
         # Evaluate the signed distance function at all of the grid points
-        for pointId in range(poly.GetNumberOfPoints()):
-            p = poly.GetPoint(pointId)
-            signedDistance = ippd.EvaluateFunction(p)
-            signedDistances.InsertNextValue(signedDistance)
+        try:
+            ippd.FunctionValue(poly.GetPoints().GetData(), signedDistances) # one C++ pass
+        except TypeError: # vtk<8.1 has no batch evaluation
+            sd = [ippd.EvaluateFunction(p) for p in vtk_to_numpy(poly.GetPoints().GetData())]
+            signedDistances.DeepCopy(numpy_to_vtk(np.array(sd, dtype=np.float32)))
+            signedDistances.SetName("SignedDistances")
 
         # add the SignedDistances to the grid
         poly.GetPointData().SetScalars(signedDistances)
@@ -1868,8 +2099,14 @@ class Actor(vtk.vtkActor, Prop):
             polyapp = vtk.vtkAppendPolyData()
             polyapp.AddInputData(poly)
             polyapp.AddInputData(tf.GetOutput())
-            polyapp.Update()
-            return self.updateMesh(polyapp.GetOutput()).clean()
+            # merge the cap with the mesh in the same pipeline update, as clean() would
+            cleanPolyData = vtk.vtkCleanPolyData()
+            cleanPolyData.PointMergingOn()
+            cleanPolyData.ConvertLinesToPointsOn()
+            cleanPolyData.ConvertPolysToLinesOn()
+            cleanPolyData.SetInputConnection(polyapp.GetOutputPort())
+            cleanPolyData.Update()
+            return self.updateMesh(cleanPolyData.GetOutput())
 
     def threshold(self, scalars, vmin=None, vmax=None, useCells=False):
         """
@@ -1971,8 +2208,10 @@ class Actor(vtk.vtkActor, Prop):
         """
         poly = self.polydata(False)
 
+        vtkscalars = None
         if isinstance(scalars, str):  # if a name is passed
-            scalars = vtk_to_numpy(poly.GetPointData().GetArray(scalars))
+            vtkscalars = poly.GetPointData().GetArray(scalars)
+            scalars = vtk_to_numpy(vtkscalars)
 
         try:
             n = len(scalars)
@@ -1993,47 +2232,31 @@ class Actor(vtk.vtkActor, Prop):
                               n, len(alpha), c=1)
                 raise RuntimeError()
         if bands:
-            scalars = utils.makeBands(scalars, bands)
-
-        if vmin is None:
-            vmin = np.min(scalars)
-        if vmax is None:
-            vmax = np.max(scalars)
-
-        lut = vtk.vtkLookupTable()  # build the look-up table
+            scalars = self._makeBands(scalars, bands, vtkscalars)
+            vtkscalars = None
+
+        arr = _scalarsArray(scalars, vtkscalars)
+        if vmin is None or vmax is None:
+            # single pass in vtk, which also caches the range on the array
+            rmin, rmax = arr.GetRange()
+            if vmin is None:
+                vmin = rmin
+            if vmax is None:
+                vmax = rmax
 
         if utils.isSequence(cmap):
             sname = "pointColors_custom"
-            lut.SetNumberOfTableValues(len(cmap))
-            lut.Build()
-            for i, c in enumerate(cmap):
-                col = colors.getColor(c)
-                r, g, b = col
-                if useAlpha:
-                    lut.SetTableValue(i, r, g, b, alpha[i])
-                else:
-                    lut.SetTableValue(i, r, g, b, alpha)
-
+            lut = _buildLUT([colors.getColor(c) for c in cmap], alpha, useAlpha)
         elif isinstance(cmap, vtk.vtkLookupTable):
             sname = "pointColors_lut"
             lut = cmap
-
         else:
             if isinstance(cmap, str):
                 sname = "pointColors_" + cmap
             else:
                 sname = "pointColors"
-            lut.SetNumberOfTableValues(256)
-            lut.Build()
-            for i in range(256):
-                r, g, b = colors.colorMap(i, cmap, 0, 256)
-                if useAlpha:
-                    idx = int(i / 256 * len(alpha))
-                    lut.SetTableValue(i, r, g, b, alpha[idx])
-                else:
-                    lut.SetTableValue(i, r, g, b, alpha)
+            lut = _buildLUT(colors._colorMapTable(cmap, 256), alpha, useAlpha, stretch=True)
 
-        arr = numpy_to_vtk(np.ascontiguousarray(scalars), deep=True)
         arr.SetName(sname)
         self.mapper.SetArrayName(sname)
         self.mapper.SetScalarRange(vmin, vmax)
@@ -2044,6 +2267,18 @@ class Actor(vtk.vtkActor, Prop):
         poly.GetPointData().SetActiveScalars(sname)
         return self
 
+    def _makeBands(self, scalars, bands, vtkarr=None):
+        """Group scalars in bands, reusing the previous result
+        if they come again from the same unchanged vtk array."""
+        if vtkarr is None:
+            return utils.makeBands(scalars, bands)
+        key = (vtkarr.GetMTime(), bands)
+        cached = self._bandsCache
+        if cached is None or cached[0] is not vtkarr or cached[1] != key:
+            cached = (vtkarr, key, utils.makeBands(scalars, bands))
+            self._bandsCache = cached
+        return cached[2]
+
     def cellColors(self, scalars, cmap="jet", alpha=1, bands=None, vmin=None, vmax=None):
         """
         Set individual cell colors by setting a scalar.
@@ -2060,8 +2295,10 @@ class Actor(vtk.vtkActor, Prop):
         """
         poly = self.polydata(False)
 
+        vtkscalars = None
         if isinstance(scalars, str):  # if a name is passed
-            scalars = vtk_to_numpy(poly.GetCellData().GetArray(scalars))
+            vtkscalars = poly.GetCellData().GetArray(scalars)
+            scalars = vtk_to_numpy(vtkscalars)
 
 #        if hasattr(scalars, 'astype'):
 #            scalars = scalars.astype(np.float)
@@ -2078,47 +2315,31 @@ class Actor(vtk.vtkActor, Prop):
                               n, len(alpha), c=1)
                 raise RuntimeError()
         if bands:
-            scalars = utils.makeBands(scalars, bands)
-
-        if vmin is None:
-            vmin = np.min(scalars)
-        if vmax is None:
-            vmax = np.max(scalars)
-
-        lut = vtk.vtkLookupTable()  # build the look-up table
+            scalars = self._makeBands(scalars, bands, vtkscalars)
+            vtkscalars = None
+
+        arr = _scalarsArray(scalars, vtkscalars)
+        if vmin is None or vmax is None:
+            # single pass in vtk, which also caches the range on the array
+            rmin, rmax = arr.GetRange()
+            if vmin is None:
+                vmin = rmin
+            if vmax is None:
+                vmax = rmax
 
         if utils.isSequence(cmap):
             sname = "cellColors_custom"
-            lut.SetNumberOfTableValues(len(cmap))
-            lut.Build()
-            for i, c in enumerate(cmap):
-                col = colors.getColor(c)
-                r, g, b = col
-                if useAlpha:
-                    lut.SetTableValue(i, r, g, b, alpha[i])
-                else:
-                    lut.SetTableValue(i, r, g, b, alpha)
-
+            lut = _buildLUT([colors.getColor(c) for c in cmap], alpha, useAlpha)
         elif isinstance(cmap, vtk.vtkLookupTable):
             sname = "cellColors_lut"
             lut = cmap
-
         else:
             if isinstance(cmap, str):
                 sname = "cellColors_" + cmap
             else:
                 sname = "cellColors"
-            lut.SetNumberOfTableValues(256)
-            lut.Build()
-            for i in range(256):
-                r, g, b = colors.colorMap(i, cmap, 0, 256)
-                if useAlpha:
-                    idx = int(i / 256 * len(alpha))
-                    lut.SetTableValue(i, r, g, b, alpha[idx])
-                else:
-                    lut.SetTableValue(i, r, g, b, alpha)
+            lut = _buildLUT(colors._colorMapTable(cmap, 256), alpha, useAlpha, stretch=True)
 
-        arr = numpy_to_vtk(np.ascontiguousarray(scalars), deep=True)
         arr.SetName(sname)
         self.mapper.SetArrayName(sname)
         self.mapper.SetScalarRange(vmin, vmax)
@@ -2143,12 +2364,13 @@ class Actor(vtk.vtkActor, Prop):
 #        if hasattr(scalars, 'astype'):
 #            scalars = scalars.astype(np.float)
 
-        arr = numpy_to_vtk(np.ascontiguousarray(scalars), deep=True)
+        buf = np.ascontiguousarray(scalars)
+        arr = numpy_to_vtk(buf, deep=np.may_share_memory(buf, scalars))  # copy caller data
         arr.SetName(name)
         poly.GetPointData().AddArray(arr)
         poly.GetPointData().SetActiveScalars(name)
         self.mapper.SetArrayName(name)
-        self.mapper.SetScalarRange(np.min(scalars), np.max(scalars))
+        self.mapper.SetScalarRange(arr.GetRange())
         self.mapper.SetScalarModeToUsePointData()
         self.mapper.ScalarVisibilityOn()
         return self
@@ -2169,12 +2391,13 @@ class Actor(vtk.vtkActor, Prop):
 #        if hasattr(scalars, 'astype'):
 #            scalars = scalars.astype(np.float)
 
-        arr = numpy_to_vtk(np.ascontiguousarray(scalars), deep=True)
+        buf = np.ascontiguousarray(scalars)
+        arr = numpy_to_vtk(buf, deep=np.may_share_memory(buf, scalars))  # copy caller data
         arr.SetName(name)
         poly.GetCellData().AddArray(arr)
         poly.GetCellData().SetActiveScalars(name)
         self.mapper.SetArrayName(name)
-        self.mapper.SetScalarRange(np.min(scalars), np.max(scalars))
+        self.mapper.SetScalarRange(arr.GetRange())
         self.mapper.SetScalarModeToUseCellData()
         self.mapper.ScalarVisibilityOn()
         return self
@@ -2189,35 +2412,34 @@ class Actor(vtk.vtkActor, Prop):
         :param bool alphaPerCell: Only matters if `alpha` is a sequence. If so:
             if `True` assume that the list of opacities is independent
             on the colors (same color cells can have different alphas),
-            this can be very slow for large meshes,
+            this builds a lookup table with one entry per cell,
 
             if `False` [default] assume that the alpha matches the color list
             (same color has the same opacity).
             This is very fast even for large meshes.
         """
-        cellData = vtk.vtkUnsignedIntArray()
-        cellData.SetName("CellColors")
-
         n = self.poly.GetNumberOfCells()
         if len(acolors) != n or (utils.isSequence(alphas) and len(alphas) != n):
             colors.printc("~times colorCellsByArray(): mismatch in input list sizes.", c=1)
             return self
 
-        lut = vtk.vtkLookupTable()
-
         if alphaPerCell:
-            lut.SetNumberOfTableValues(n)
-            lut.Build()
-            cols = colors.getColor(acolors)
-            if not utils.isSequence(alphas):
-                alphas = [alphas] * n
-            for i in range(n):
-                cellData.InsertNextValue(i)
-                c = cols[i]
-                lut.SetTableValue(i, c[0], c[1], c[2], alphas[i])
+            cellids = np.arange(n, dtype=np.uint32)
+            lut = _buildLUT(colors.getColor(acolors), alphas, utils.isSequence(alphas))
         else:
-            ucolors, uids, inds = np.unique(acolors, axis=0,
-                                            return_index=True, return_inverse=True)
+            rgb = np.asarray(acolors)
+            if rgb.ndim == 2 and rgb.shape[1] == 3 and rgb.dtype.kind in "uif":
+                # pack each color into the 24 bits it takes in the lookup table,
+                # a 1D unique is much faster than a row-wise one
+                big = (rgb > 1).any(axis=1)  # (R,G,B) rows, as in getColor()
+                q = np.clip(np.where(big[:, None], rgb, rgb * 255.0) + 0.5, 0, 255)
+                q = q.astype(np.uint32)
+                key = (q[:, 0] << 16) | (q[:, 1] << 8) | q[:, 2]
+                _, uids, inds = np.unique(key, return_index=True, return_inverse=True)
+                ucolors = rgb[uids]
+            else:
+                ucolors, uids, inds = np.unique(acolors, axis=0,
+                                                return_index=True, return_inverse=True)
             nc = len(ucolors)
 
             if nc == 1:
@@ -2228,21 +2450,14 @@ class Actor(vtk.vtkActor, Prop):
                     self.alpha(alphas)
                 return self
 
-            for i in range(n):
-                cellData.InsertNextValue(inds[i])
-
-            lut.SetNumberOfTableValues(nc)
-            lut.Build()
-
-            cols = colors.getColor(ucolors)
-
-            if not utils.isSequence(alphas):
-                alphas = np.ones(n)
-
-            for i in range(nc):
-                c = cols[i]
-                lut.SetTableValue(i, c[0], c[1], c[2], alphas[uids[i]])
+            cellids = np.asarray(inds, dtype=np.uint32).ravel()
+            if utils.isSequence(alphas):
+                lut = _buildLUT(colors.getColor(ucolors), np.asarray(alphas)[uids], True)
+            else:
+                lut = _buildLUT(colors.getColor(ucolors), alphas, False)
 
+        cellData = numpy_to_vtk(cellids, array_type=vtk.VTK_UNSIGNED_INT)
+        cellData.SetName("CellColors")
         self.poly.GetCellData().SetScalars(cellData)
         self.poly.GetCellData().Modified()
         self.mapper.SetScalarRange(0, lut.GetNumberOfTableValues()-1)
@@ -2260,26 +2475,20 @@ class Actor(vtk.vtkActor, Prop):
         :param list acolors: list of color for each vertex
         :param list alphas: single value or list of transparencies for each vertex
         """
-        ptData = vtk.vtkUnsignedIntArray()
-        ptData.SetName("VertexColors")
-        lut = vtk.vtkLookupTable()
         n = self.poly.GetNumberOfPoints()
         if len(acolors) != n or (utils.isSequence(alphas) and len(alphas) != n):
             colors.printc("~times colorVerticesByArray(): mismatch in input list sizes.", c=1)
             return self
-        lut.SetNumberOfTableValues(n)
-        lut.Build()
-        cols = colors.getColor(acolors)
-        if not utils.isSequence(alphas):
-            alphas = [alphas] * n
-        for i in range(n):
-            ptData.InsertNextValue(i)
-            c = cols[i]
-            lut.SetTableValue(i, c[0], c[1], c[2], alphas[i])
+        # premap to unsigned char RGBA so that the mapper uses them as direct colors
+        # instead of going through a n-entries lookup table
+        cols = np.array([c[:3] for c in colors.getColor(acolors)], dtype=float)
+        rgba = np.empty((n, 4), dtype=np.uint8)
+        rgba[:, :3] = np.clip(cols * 255 + 0.5, 0, 255)  # rounded, as _buildLUT() does
+        rgba[:, 3] = np.clip(np.asarray(alphas, dtype=float) * 255 + 0.5, 0, 255)
+        ptData = numpy_to_vtk(rgba, array_type=vtk.VTK_UNSIGNED_CHAR)
+        ptData.SetName("VertexColors")
         self.poly.GetPointData().SetScalars(ptData)
         self.poly.GetPointData().Modified()
-        self.mapper.SetScalarRange(0, n-1)
-        self.mapper.SetLookupTable(lut)
         self.mapper.SetArrayName("VertexColors")
         self.mapper.SetScalarModeToUsePointData()
         self.mapper.ScalarVisibilityOn()
@@ -2295,11 +2504,10 @@ class Actor(vtk.vtkActor, Prop):
             colors.printc('~times addPointVectors Error: Number of vectors != nr. of points',
                           len(vectors), poly.GetNumberOfPoints(), c=1)
             raise RuntimeError()
-        arr = vtk.vtkDoubleArray()
-        arr.SetNumberOfComponents(3)
+        vecs = np.ascontiguousarray(vectors, dtype=np.float64).reshape(-1, 3)
+        # a buffer built here (e.g. from a list) can be handed over without copying
+        arr = numpy_to_vtk(vecs, deep=np.may_share_memory(vecs, vectors))
         arr.SetName(name)
-        for v in vectors:
-            arr.InsertNextTuple(v)
         poly.GetPointData().AddArray(arr)
         poly.GetPointData().SetActiveVectors(name)
         return self
@@ -2366,20 +2574,17 @@ class Actor(vtk.vtkActor, Prop):
         poly = self.polydata(False)
 
         if name_or_idx is None:  # get mode behaviour
-            ncd = poly.GetCellData().GetNumberOfArrays()
-            npd = poly.GetPointData().GetNumberOfArrays()
-            nfd = poly.GetFieldData().GetNumberOfArrays()
-            arrs = []
-            for i in range(npd):
-                #print(i, "PointData", poly.GetPointData().GetArrayName(i))
-                arrs.append(["PointData", poly.GetPointData().GetArrayName(i)])
-            for i in range(ncd):
-                #print(i, "CellData", poly.GetCellData().GetArrayName(i))
-                arrs.append(["CellData", poly.GetCellData().GetArrayName(i)])
-            for i in range(nfd):
-                #print(i, "FieldData", poly.GetFieldData().GetArrayName(i))
-                arrs.append(["FieldData", poly.GetFieldData().GetArrayName(i)])
-            return arrs
+            # the name list is rebuilt only when the mesh or its arrays change
+            key = (id(poly), poly.GetMTime())
+            if self._arrayNames is None or self._arrayNames[0] != key:
+                arrs = []
+                for dname, data in (("PointData", poly.GetPointData()),
+                                    ("CellData", poly.GetCellData()),
+                                    ("FieldData", poly.GetFieldData())):
+                    for i in range(data.GetNumberOfArrays()):
+                        arrs.append((dname, data.GetArrayName(i)))
+                self._arrayNames = (key, arrs)
+            return [list(a) for a in self._arrayNames[1]]
 
         else:  # set mode
 
@@ -2458,13 +2663,14 @@ class Actor(vtk.vtkActor, Prop):
 
         |skeletonize| |skeletonize.py|_
         """
-        poly = self.polydata(True)
         if N:  # N = desired number of points
-            Np = poly.GetNumberOfPoints()
+            # the transform does not change the point count, no need for a copy yet
+            Np = self.polydata(False).GetNumberOfPoints()
             fraction = float(N) / Np
             if fraction >= 1:
                 return self
 
+        poly = self.polydata(True)
         if 'quad' in method:
             decimate = vtk.vtkQuadricDecimation()
             decimate.VolumePreservationOn()
@@ -2497,9 +2703,10 @@ class Actor(vtk.vtkActor, Prop):
         pts = self.coordinates()
         n = len(pts)
         ns = np.random.randn(n, 3) * sigma * sz / 100
+        # a new vtkPoints so that meshes sharing the old one are left untouched,
+        # SetData() adopts the buffer so nothing needs to be preallocated
         vpts = vtk.vtkPoints()
-        vpts.SetNumberOfPoints(n)
-        vpts.SetData(numpy_to_vtk(pts + ns, deep=True))
+        vpts.SetData(numpy_to_vtk(pts + ns))
         self.poly.SetPoints(vpts)
         self.poly.GetPoints().Modified()
         self.addPointVectors(-ns, 'GaussNoise')
@@ -2607,6 +2814,14 @@ class Actor(vtk.vtkActor, Prop):
             vtknormals = self.polydata().GetPointData().GetNormals()
         return vtk_to_numpy(vtknormals)
 
+    def _isIdentity(self):
+        """Check if the actor matrix is the identity, only looking at the matrix
+        again after the actor (or its user matrix/transform) was modified."""
+        mt = self.GetMTime()
+        if self._identity is None or self._identity[0] != mt:
+            self._identity = (mt, utils.isIdentity(self.GetMatrix()))
+        return self._identity[1]
+
     def polydata(self, transformed=True):
         """
         Returns the ``vtkPolyData`` object of an ``Actor``.
@@ -2619,8 +2834,7 @@ class Actor(vtk.vtkActor, Prop):
                 self.poly = self.mapper.GetInput()
             return self.poly
         else:
-            M = self.GetMatrix()
-            if utils.isIdentity(M):
+            if self._isIdentity():
                 # if identity return the original polydata
                 if not self.poly:
                     self.poly = self.mapper.GetInput()
@@ -2628,13 +2842,22 @@ class Actor(vtk.vtkActor, Prop):
             else:
                 # otherwise make a copy that corresponds to
                 # the actual position in space of the actor
+                if not self.poly:
+                    self.poly = self.mapper.GetInput()
+                # reuse the last copy if neither the mesh, the actor nor the copy changed
+                key = (id(self.poly), self.poly.GetMTime(), self.GetMTime())
+                tc = self._transformedPoly
+                if tc is not None and tc[0] == key and tc[1].GetMTime() == tc[2]:
+                    return tc[1]
                 transform = vtk.vtkTransform()
-                transform.SetMatrix(M)
+                transform.SetMatrix(self.GetMatrix())
                 tp = vtk.vtkTransformPolyDataFilter()
                 tp.SetTransform(transform)
                 tp.SetInputData(self.poly)
                 tp.Update()
-                return tp.GetOutput()
+                tpoly = tp.GetOutput()
+                self._transformedPoly = (key, tpoly, tpoly.GetMTime())
+                return tpoly
 
     def coordinates(self, transformed=True, copy=False):
         """
@@ -2646,32 +2869,39 @@ class Actor(vtk.vtkActor, Prop):
 
         .. hint:: |align1.py|_
         """
-        poly = self.polydata(transformed)
+        pts = vtk_to_numpy(self.polydata(False).GetPoints().GetData())
+        if transformed:
+            if not self._isIdentity():
+                M = self.GetMatrix()
+                # apply the actor matrix to the points without running a vtk filter
+                M = np.array([[M.GetElement(i, j) for j in range(4)] for i in range(4)])
+                return (np.dot(pts, M[:3, :3].T) + M[:3, 3]).astype(pts.dtype, copy=False)
         if copy:
-            return np.array(vtk_to_numpy(poly.GetPoints().GetData()))
+            return np.array(pts)
         else:
-            return vtk_to_numpy(poly.GetPoints().GetData())
+            return pts
 
     def isInside(self, point, tol=0.0001):
         """
         Return True if point is inside a polydata closed surface.
         """
         poly = self.polydata(True)
-        points = vtk.vtkPoints()
-        points.InsertNextPoint(point)
-        pointsPolydata = vtk.vtkPolyData()
-        pointsPolydata.SetPoints(points)
-        sep = vtk.vtkSelectEnclosedPoints()
-        sep.SetTolerance(tol)
-        sep.CheckSurfaceOff()
-        sep.SetInputData(pointsPolydata)
-        sep.SetSurfaceData(poly)
-        sep.Update()
-        return sep.IsInside(0)
+        # keep the selector initialized on the surface (and its locator)
+        # for as long as the surface is unchanged
+        cache = self._enclosedSel
+        if cache is None or cache[0] is not poly or cache[1] != (poly.GetMTime(), tol):
+            sep = vtk.vtkSelectEnclosedPoints()
+            sep.SetTolerance(tol)
+            sep.CheckSurfaceOff()
+            sep.Initialize(poly)
+            cache = (poly, (poly.GetMTime(), tol), sep)
+            self._enclosedSel = cache
+        return cache[2].IsInsideSurface(point[0], point[1], point[2])
 
     def insidePoints(self, points, invert=False, tol=1e-05):
         """
-        Return the sublist of points that are inside a polydata closed surface.
+        Return the sublist of points that are inside a polydata closed surface,
+        as a numpy array.
 
         |pca| |pca.py|_
         """
@@ -2688,8 +2918,9 @@ class Actor(vtk.vtkActor, Prop):
         # if openEdges != 0:
         #    colors.printc("~lightning Warning: polydata is not a closed surface", c=5)
 
+        pts = np.asarray(points)
         vpoints = vtk.vtkPoints()
-        vpoints.SetData(numpy_to_vtk(points, deep=True))
+        vpoints.SetData(numpy_to_vtk(pts, deep=True))
         pointsPolydata = vtk.vtkPolyData()
         pointsPolydata.SetPoints(vpoints)
         sep = vtk.vtkSelectEnclosedPoints()
@@ -2698,26 +2929,32 @@ class Actor(vtk.vtkActor, Prop):
         sep.SetSurfaceData(poly)
         sep.Update()
 
-        mask1, mask2 = [], []
-        for i, p in enumerate(points):
-            if sep.IsInside(i):
-                mask1.append(p)
-            else:
-                mask2.append(p)
+        # the filter flags each point in its output, read them all at once
+        sel = sep.GetOutput().GetPointData().GetArray("SelectedPoints")
+        mask = vtk_to_numpy(sel).astype(bool)
         if invert:
-            return mask2
+            return pts[~mask]
         else:
-            return mask1
+            return pts[mask]
 
     def cellCenters(self):
         """Get the list of cell centers of the mesh surface.
 
         |delaunay2d| |delaunay2d.py|_
         """
-        vcen = vtk.vtkCellCenters()
-        vcen.SetInputData(self.polydata(True))
-        vcen.Update()
-        return vtk_to_numpy(vcen.GetOutput().GetPoints().GetData())
+        poly = self.polydata(True)
+        key = (poly.GetMTime(), poly.GetNumberOfCells())
+        cached = self._cellCenters
+        if cached is None or cached[0] is not poly or cached[1] != key:
+            vcen = vtk.vtkCellCenters()
+            vcen.VertexCellsOff()
+            if hasattr(vcen, "CopyArraysOff"):  # only the centers are needed
+                vcen.CopyArraysOff()
+            vcen.SetInputData(poly)
+            vcen.Update()
+            cached = (poly, key, vtk_to_numpy(vcen.GetOutput().GetPoints().GetData()))
+            self._cellCenters = cached
+        return np.array(cached[2])  # the cached centers stay untouched by the caller
 
     def boundaries(self, boundaryEdges=True, featureAngle=65, nonManifoldEdges=True):
         """
@@ -2755,26 +2992,22 @@ class Actor(vtk.vtkActor, Prop):
         mesh.GetPointCells(index, cellIdList)
 
         idxs = []
+        seen = set([index])  # constant time membership, idxs keeps the order
+        pointIdList = vtk.vtkIdList()
         for i in range(cellIdList.GetNumberOfIds()):
-            pointIdList = vtk.vtkIdList()
             mesh.GetCellPoints(cellIdList.GetId(i), pointIdList)
             for j in range(pointIdList.GetNumberOfIds()):
                 idj = pointIdList.GetId(j)
-                if idj == index:
-                    continue
-                if idj in idxs:
+                if idj in seen:
                     continue
+                seen.add(idj)
                 idxs.append(idj)
 
         if returnIds:
             return idxs
         else:
-            trgp = []
-            for i in idxs:
-                p = [0, 0, 0]
-                mesh.GetPoints().GetPoint(i, p)
-                trgp.append(p)
-            return np.array(trgp)
+            pts = vtk_to_numpy(mesh.GetPoints().GetData())
+            return np.array(pts[idxs], dtype=float)
 
     def connectedCells(self, index, returnIds=False):
         """Find all cellls connected to an input vertex specified by its index."""
@@ -2825,40 +3058,35 @@ class Actor(vtk.vtkActor, Prop):
 
             |intline|
         """
-        if not self.line_locator:
-            line_locator = vtk.vtkOBBTree()
-            line_locator.SetDataSet(self.polydata(True))
-            line_locator.BuildLocator()
-            self.line_locator = line_locator
+        poly = self.polydata(True)
+        if self.line_locator is None or self.line_locator.GetDataSet() is not poly:
+            self.line_locator = vtk.vtkOBBTree()
+            self.line_locator.SetDataSet(poly)
+        self.line_locator.Update()  # rebuilds only if the mesh was modified
 
         intersectPoints = vtk.vtkPoints()
-        intersection = [0, 0, 0]
         self.line_locator.IntersectWithLine(p0, p1, intersectPoints, None)
-        pts = []
-        for i in range(intersectPoints.GetNumberOfPoints()):
-            intersectPoints.GetPoint(i, intersection)
-            pts.append(list(intersection))
-        return pts
+        if not intersectPoints.GetNumberOfPoints():
+            return []
+        return vtk_to_numpy(intersectPoints.GetData()).tolist()
 
     def projectOnPlane(self, direction='z'):
         """
         Project the mesh on one of the Cartesian planes.
         """
-        coords = self.coordinates(transformed=True)
-        if 'z' == direction:
-            coords[:, 2] = self.GetOrigin()[2]
-            self.z(self.zbounds()[0])
-        elif 'x' == direction:
-            coords[:, 0] = self.GetOrigin()[0]
-            self.x(self.xbounds()[0])
-        elif 'y' == direction:
-            coords[:, 1] = self.GetOrigin()[1]
-            self.y(self.ybounds()[0])
-        else:
+        k = {'x': 0, 'y': 1, 'z': 2}.get(direction)
+        if k is None:
             colors.printc("~times Error in projectOnPlane(): unknown direction", direction, c=1)
             raise RuntimeError()
-        self.alpha(0.1).polydata(False).GetPoints().Modified()
-        return self
+        # flatten the world coordinates, so that a moved or rotated actor
+        # is projected along the world axis, through its own origin
+        plane = self.GetPosition()[k] + self.GetOrigin()[k]
+        poly = vtk.vtkPolyData()
+        poly.DeepCopy(self.polydata(True))
+        vtk_to_numpy(poly.GetPoints().GetData())[:, k] = plane
+        poly.GetPoints().Modified()
+        self.PokeMatrix(vtk.vtkMatrix4x4())  # identity
+        return self.updateMesh(poly).alpha(0.1)
 
     def silhouette(self, direction=None, borderEdges=True, featureAngle=None):
         """
@@ -2879,7 +3107,9 @@ class Actor(vtk.vtkActor, Prop):
         sil.SetInputData(self.polydata())
         if direction is None:
             b = self.GetBounds()
-            i = np.argmin([b[1]-b[0], b[3]-b[2], b[5]-b[4]])
+            dx, dy, dz = b[1]-b[0], b[3]-b[2], b[5]-b[4]
+            # shortest side, first one on ties as np.argmin would pick
+            i = 0 if dx <= dy and dx <= dz else (1 if dy <= dz else 2)
             d = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
             sil.SetVector(d[i])
             sil.SetDirectionToSpecifiedVector()
@@ -2953,7 +3183,7 @@ class Assembly(vtk.vtkAssembly, Prop):
     def __add__(self, actors):
         if isinstance(actors, list):
             for a in actors:
-                self.AddPart(self)
+                self.AddPart(a)
         elif isinstance(actors, vtk.vtkAssembly):
             acts = actors.getActors()
             for a in acts:
@@ -2995,17 +3225,15 @@ class Image(vtk.vtkImageActor, Prop):
         Prop.__init__(self)
 
         if len(array):
-            iac = vtk.vtkImageAppendComponents()
-            for i in range(3):
-#                arr = np.flip(np.flip(array[:,:,i], 0), 0).ravel()
-                arr = np.flip(array[:,:,i], 0).ravel()
-                varb = numpy_to_vtk(arr, deep=True, array_type=vtk.VTK_UNSIGNED_CHAR)
-                imgb = vtk.vtkImageData()
-                imgb.SetDimensions(array.shape[1], array.shape[0], 1)
-                imgb.GetPointData().SetScalars(varb)
-                iac.AddInputData(0, imgb)
-            iac.Update()
-            self.SetInputData(iac.GetOutput())
+            # flip rows and keep r,g,b in one packed uchar buffer,
+            # handed to vtk as a single 3-component array
+            rgb = np.ascontiguousarray(array[::-1, :, :3], dtype=np.uint8)
+            varb = numpy_to_vtk(rgb.reshape(-1, 3), deep=np.may_share_memory(rgb, array),
+                                array_type=vtk.VTK_UNSIGNED_CHAR)
+            img = vtk.vtkImageData()
+            img.SetDimensions(array.shape[1], array.shape[0], 1)
+            img.GetPointData().SetScalars(varb)
+            self.SetInputData(img)
 
     def alpha(self, a=None):
         """Set/get actor's transparency."""
@@ -3056,6 +3284,9 @@ class Volume(vtk.vtkVolume, Prop):
     :param list origin: set volume origin coordinates
     :param list spacing: voxel dimensions in x, y and z.
     :param str mapperType: either 'gpu', 'opengl_gpu', 'fixed' or 'smart'
+    :param bool quantize: store a floating point numpy input as 8 bit voxels,
+        linearly mapping its range to 0-255, which is much lighter on the ray casting.
+        Offset and step of the mapping are kept in ``volume.info['quantize']``.
 
     :param int mode: define the volumetric rendering style:
 
@@ -3079,6 +3310,7 @@ class Volume(vtk.vtkVolume, Prop):
                  origin=None,
                  spacing=None,
                  mapperType='gpu',
+                 quantize=False,
                  ):
 
         vtk.vtkVolume.__init__(self)
@@ -3090,9 +3322,19 @@ class Volume(vtk.vtkVolume, Prop):
         if inputobj is None:
             img = vtk.vtkImageData()
         elif utils.isSequence(inputobj):
-            varr = numpy_to_vtk(inputobj.ravel(), deep=True, array_type=vtk.VTK_FLOAT)
+            # one float32 conversion, copied again only if it is the caller's array
+            arr = np.ascontiguousarray(inputobj, dtype=np.float32)
+            if quantize and np.asarray(inputobj).dtype.kind == "f":
+                mn, mx = float(arr.min()), float(arr.max())
+                step = (mx - mn) / 255.0 if mx > mn else 1.0
+                q = np.rint((arr - mn) / step).astype(np.uint8)
+                varr = numpy_to_vtk(q.ravel(), array_type=vtk.VTK_UNSIGNED_CHAR)
+                self.info['quantize'] = (mn, step)  # value = mn + step * voxel
+            else:
+                varr = numpy_to_vtk(arr.ravel(), deep=np.may_share_memory(arr, inputobj),
+                                    array_type=vtk.VTK_FLOAT)
             img = vtk.vtkImageData()
-            img.SetDimensions(inputobj.shape)
+            img.SetDimensions(arr.shape[::-1])  # C order: the last axis runs fastest, along x
             img.GetPointData().SetScalars(varr)
         elif "ImageData" in inputtype:
             img = inputobj
@@ -3216,9 +3458,11 @@ class Volume(vtk.vtkVolume, Prop):
                 ctf.AddRGBPoint(smin, r,g,b) # constant color
                 ctf.AddRGBPoint(smax, r,g,b)
             elif colors._mapscales:
-                for x in np.linspace(smin, smax, num=64, endpoint=True):
-                    r,g,b = colors.colorMap(x, name=col, vmin=smin, vmax=smax)
-                    ctf.AddRGBPoint(x, r, g, b)
+                # sample the map at 64 nodes in one call and pass them as a flat (x,r,g,b) list
+                xs = np.linspace(smin, smax, num=64, endpoint=True)
+                rgb = colors.colorMap(xs, name=col, vmin=smin, vmax=smax)
+                nodes = np.ascontiguousarray(np.column_stack([xs, rgb]), dtype=np.float64)
+                ctf.FillFromDataPointer(64, nodes.ravel())
         elif isinstance(col, int):
             r, g, b = colors.getColor(col)
             ctf.AddRGBPoint(smin, r,g,b) # constant color
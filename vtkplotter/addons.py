@@ -203,10 +203,10 @@ def addScalarBar3D(
         lut = vtk.vtkLookupTable()
         lut.SetNumberOfTableValues(n)
         lut.Build()
-        for i in range(n):
-            r, g, b = colors.colorMap(i, cmap, 0, n)
+        for i, (r, g, b) in enumerate(colors._colorMapTable(cmap, n)):
             lut.SetTableValue(i, r, g, b, alpha)
-        arr = numpy_to_vtk(numpy.ascontiguousarray(scalars), deep=True)
+        buf = numpy.ascontiguousarray(scalars)
+        arr = numpy_to_vtk(buf, deep=numpy.may_share_memory(buf, scalars))
         vmin, vmax = numpy.min(scalars), numpy.max(scalars)
         mapper.SetScalarRange(vmin, vmax)
         mapper.SetLookupTable(lut)
@@ -214,8 +214,8 @@ color_nicks = {  # color nicknames
 }
 
 
-# available colormap names from matplotlib:
-_mapscales_cmaps = (
+# available colormap names from matplotlib (a frozenset for fast lookups):
+_mapscales_cmaps = frozenset((
     "Accent",    "Accent_r",    "Blues",     "Blues_r",
     "BrBG",      "BrBG_r",      "BuGn",      "BuGn_r",
     "BuPu",      "BuPu_r",      "CMRmap",    "CMRmap_r",
@@ -256,8 +256,8 @@ _mapscales_cmaps = (
     "tab20",     "tab20_r",     "tab20b",     "tab20b_r",
     "tab20c",    "tab20c_r",    "terrain",    "terrain_r",
     "twilight",  "twilight_r",  "twilight_shifted", "twilight_shifted_r",
-    "viridis",   "viridis_r",   "winter",     "winter_r"
-)
+    "viridis",   "viridis_r",   "winter",     "winter_r",
+))
 
 
 def _isSequence(arg):
@@ -448,11 +448,7 @@ def colorMap(value, name="jet", vmin=None, vmax=None):
         values = np.clip(values, vmin, vmax)
         values -= vmin
         values = values / (vmax - vmin)
-        cols = []
-        mp = cm_mpl.get_cmap(name=name)
-        for v in values:
-            cols.append(mp(v)[0:3])
-        return np.array(cols)
+        return mp(values)[:, 0:3]  # the color map evaluates the whole array at once
     else:
         value -= vmin
         value /= vmax - vmin
@@ -463,6 +459,25 @@ def colorMap(value, name="jet", vmin=None, vmax=None):
         return mp(value)[0:3]
 
 
+_cmap_tables = dict()
+
+def _colorMapTable(name, N=256):
+    """Return `N` (r,g,b) colors sampling the color map, cached by color map name.
+    Same colors as ``colorMap(i, name, 0, N)`` for each `i`, in a single call."""
+    if not _mapscales:
+        return [colorMap(0, name, 0, N)] * N  # gray, warn only once
+    if isinstance(name, str) and (name, N) in _cmap_tables:
+        return _cmap_tables[(name, N)]
+    if isinstance(name, matplotlib.colors.LinearSegmentedColormap):
+        mp = name
+    else:
+        mp = cm_mpl.get_cmap(name=name)
+    table = mp(np.clip(np.arange(N) / N, 0, 0.999))[:, 0:3]
+    if isinstance(name, str):
+        _cmap_tables[(name, N)] = table
+    return table
+
+
 def makePalette(color1, color2, N, hsv=True):
     """
     Generate N colors starting from `color1` to `color2`
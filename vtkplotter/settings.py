@@ -49,6 +49,9 @@ renderPointsAsSpheres = True
 
 renderLinesAsTubes = False
 
+# interpolate scalars in texture space before mapping them to colors
+interpolateScalarsBeforeMapping = True
+
 # remove hidden lines when in wireframe mode
 hiddenLineRemoval = False
 
@@ -263,8 +263,7 @@ def Glyph(actor, glyphObj, orientationArray=None,
         lut = vtk.vtkLookupTable()
         lut.SetNumberOfTableValues(512)
         lut.Build()
-        for i in range(512):
-            r, g, b = colors.colorMap(i, cmap, 0, 512)
+        for i, (r, g, b) in enumerate(colors._colorMapTable(cmap, 512)):
             lut.SetTableValue(i, r, g, b, 1)
         gactor.mapper.SetLookupTable(lut)
         gactor.mapper.ScalarVisibilityOn()
@@ -30,6 +30,7 @@ __all__ = [
     "cart2spher",
     "cart2pol",
     "pol2cart",
+    "rotatePoints",
     "humansort",
     "resampleArrays",
     "printHistogram",
@@ -567,6 +568,23 @@ def pol2cart(theta, rho):
     return x, y
 
 
+def rotatePoints(points, angle, axis=(1, 0, 0), center=(0, 0, 0), rad=False):
+    """
+    Rotate a set of points by `angle` around an `axis` passing through `center`.
+    All points are rotated at once with Rodrigues' formula.
+
+    :param list points: list or array of 3D points.
+    :param bool rad: set to True if angle is in radians.
+    """
+    if not rad:
+        angle = np.deg2rad(angle)
+    k = versor(np.asarray(axis, dtype=np.float64))
+    v = np.asarray(points, dtype=np.float64) - center
+    c, s = np.cos(angle), np.sin(angle)
+    rv = v * c + np.cross(k, v) * s + np.outer(np.dot(v, k) * (1 - c), k)
+    return rv + center
+
+
 def isIdentity(M, tol=1e-06):
     """Check if vtkMatrix4x4 is Identity."""
     for i in [0, 1, 2, 3]:
@@ -1040,16 +1058,12 @@ def makeBands(inputlist, numberOfBands):
     bb = np.linspace(vmin, vmax, numberOfBands, endpoint=0)
     dr = bb[1] - bb[0]
     bb += dr / 2
-    tol = dr / 2 * 1.001
-
-    newlist = []
-    for s in inputlist:
-        for b in bb:
-            if abs(s - b) < tol:
-                newlist.append(b)
-                break
-
-    return np.array(newlist)
+    if not dr:
+        return np.array(inputlist, dtype=float)
+    # index of the first band center within dr/2*1.001, in one vectorized pass
+    x = (np.asarray(inputlist, dtype=float) - vmin) / dr
+    ib = np.clip(np.floor(x - 1.0005).astype(int) + 1, 0, numberOfBands - 1)
+    return bb[ib]
 
 
 
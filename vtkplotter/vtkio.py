@@ -835,7 +835,7 @@ def _np_dump(obj):
         adict['type'] = 'volume'
         imgdata = obj.inputdata()
         arr = vtk_to_numpy(imgdata.GetPointData().GetScalars())
-        adict['array'] = arr.reshape(imgdata.GetDimensions())
+        adict['array'] = arr.reshape(imgdata.GetDimensions()[::-1])  # C order, as Volume() reads it
         adict['mode'] = obj.mode()
         adict['jittering'] = obj.mapper.GetUseJittering()
 